@@ -1,9 +1,22 @@
+import contextlib
+import functools
 import sys
 import tkinter as tk
 from tkinter import ttk, PhotoImage, messagebox
 import os
+from noctua.hardware import ComWorker
 from noctua.logger import Logger
 
+_IMAGE_BASE_DIR = (
+    os.path.join(sys._MEIPASS, "resources", "images")  # For compiled mode
+    if getattr(sys, "frozen", False)
+    else os.path.abspath(
+        os.path.join(
+            os.path.dirname(__file__), "..", "..", "resources", "images"
+        )  # For local mode
+    )
+)
+
 
 class NoctuaGUI:
     """
@@ -33,6 +46,16 @@ class NoctuaGUI:
         self.logging_option_var = tk.BooleanVar(value=False)
         self.logger = None
 
+        # Decoded images keyed by filename and the single label showing them
+        self._image_cache: dict[str, PhotoImage] = {}
+        self._bg_label = None
+
+        # Reports run on a single long-lived, COM-initialized daemon thread so
+        # the GUI stays responsive and closing the window never waits for it
+        self._report_worker = ComWorker("noctua-report")
+        # Set once the application closes; the worker must not touch Tk after that
+        self.is_closed = False
+
         self.initialize_gui()
 
     def initialize_gui(self):
@@ -51,16 +74,15 @@ class NoctuaGUI:
         self.root_window.geometry("800x600")
         self.root_window.title("NoctuaLight - Hardware Report Application")
         self.root_window.configure(background="#f4f4f4")
+        self.root_window.protocol("WM_DELETE_WINDOW", self.application_closure_callback)
 
     def set_background_image(self, image_filename):
         """
         Loads and sets a background image for the main window.
         """
-        image_path = self.resolve_image_path(image_filename)
-        if image_path:
-            self.background_image = PhotoImage(file=image_path)
-            background_label = tk.Label(self.root_window, image=self.background_image)
-            background_label.place(relwidth=1, relheight=1)
+        background_image = self.load_image(image_filename)
+        if background_image is not None:
+            self.display_background(background_image)
 
     def build_main_interface_frame(self):
         """
@@ -154,29 +176,33 @@ class NoctuaGUI:
         """
         Displays a loading screen with a specified background image during report generation.
         """
-        loading_image_path = self.resolve_image_path(image_filename)
-        if loading_image_path:
-            self.loading_image = PhotoImage(file=loading_image_path)
-            loading_label = tk.Label(self.root_window, image=self.loading_image)
-            loading_label.place(relwidth=1, relheight=1)
+        loading_image = self.load_image(image_filename)
+        if loading_image is not None:
+            self.display_background(loading_image)
+            # Cover the main frame while the report is being generated
+            self._bg_label.lift()
 
-        # Delay 100ms, then generate report
-        self.root_window.after(100, self.generate_report)
+        # Tk widgets may only be read on the GUI thread
+        pc_name = self.pc_name_entry_field.get()
+        self._report_worker.submit(self._run_report, pc_name)
 
-    def generate_report(self):
+    def _run_report(self, pc_name):
         """
-        Executes the report generation process and shows completion dialog.
+        Executes the report generation process on the worker thread and schedules
+        the completion dialog on the GUI thread.
         """
         try:
-            pc_name = self.pc_name_entry_field.get()
             self.report_generation_callback(pc_name)
         except Exception as error:
             if self.logger:
-                self.logger.error(f"Error during report generation: {error}")
+                self.logger.error("Error during report generation: %s", error)
             else:
                 print(f"Error: {error}")
         finally:
-            self.display_report_completion_message()
+            if not self.is_closed:
+                # The window may still be destroyed between the check and the call
+                with contextlib.suppress(RuntimeError, tk.TclError):
+                    self.root_window.after(0, self.display_report_completion_message)
 
     def display_report_completion_message(self):
         """
@@ -190,18 +216,34 @@ class NoctuaGUI:
         if result:
             self.application_closure_callback()
 
-    def resolve_image_path(self, filename):
+    def load_image(self, image_filename):
+        """
+        Returns the decoded image for a file, decoding each file only once.
+        """
+        image = self._image_cache.get(image_filename)
+        if image is None:
+            image_path = self.resolve_image_path(image_filename)
+            if not image_path:
+                return None
+            image = PhotoImage(file=image_path)
+            self._image_cache[image_filename] = image
+        return image
+
+    def display_background(self, image):
+        """
+        Shows an image on the full-window background label, creating it on first use.
+        """
+        if self._bg_label is None:
+            self._bg_label = tk.Label(self.root_window, image=image)
+            self._bg_label.place(relwidth=1, relheight=1)
+        else:
+            self._bg_label.configure(image=image)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def resolve_image_path(filename):
         """
         Determines the absolute path of an image file.
         """
-        base_dir = (
-            os.path.join(sys._MEIPASS, "resources", "images")  # For compiled mode
-            if getattr(sys, "frozen", False)
-            else os.path.abspath(
-                os.path.join(
-                    os.path.dirname(__file__), "..", "..", "resources", "images"
-                )  # For local mode
-            )
-        )
-        image_path = os.path.join(base_dir, filename)
+        image_path = os.path.join(_IMAGE_BASE_DIR, filename)
         return image_path if os.path.exists(image_path) else None
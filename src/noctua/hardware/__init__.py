@@ -6,6 +6,8 @@ from various components like CPU, Disk, GPU, RAM, Motherboard, BIOS, Network, an
 """
 
 import logging
+from concurrent.futures import Future
+from ._wmi import ComWorker
 from .cpu import CPU
 from .disk import Disk
 from .gpu import GPU
@@ -15,18 +17,127 @@ from .bios import BIOS
 from .network import Network
 from .system import System
 
+# Component names in report order
+_COMPONENT_NAMES = (
+    "system",
+    "cpu",
+    "gpu",
+    "ram",
+    "disk",
+    "network",
+    "motherboard",
+    "bios",
+)
+
 
 class HardwareInfo:
-    """Class to fetch and aggregate hardware information."""
+    """Class to fetch and aggregate hardware information.
+
+    Components are created on first access, so only the components that are
+    actually used pay for their initialization. gather_all and submit_all give
+    every component its own long-lived COM worker thread: the component is
+    created there, keeps its per-thread WMI connection across calls, and runs
+    concurrently with the others.
+    """
 
     def __init__(self, logger: logging.Logger):
         """Initialize the HardwareInfo class with a logger."""
         self.logger = logger
-        self.system = System(logger)
-        self.cpu = CPU(logger)
-        self.disk = Disk(logger)
-        self.gpu = GPU(logger)
-        self.ram = RAM(logger)
-        self.motherboard = Motherboard(logger)
-        self.bios = BIOS(logger)
-        self.network = Network(logger)
+        self._cache: dict[str, object] = {}
+        self._workers: dict[str, ComWorker] = {}
+
+    def _component(self, name: str, factory):
+        """Return the cached component instance, creating it with factory on first use."""
+        component = self._cache.get(name)
+        if component is None:
+            component = factory()
+            self._cache[name] = component
+        return component
+
+    @property
+    def system(self) -> System:
+        """System component."""
+        return self._component("system", lambda: System(self.logger))
+
+    @property
+    def cpu(self) -> CPU:
+        """CPU component."""
+        return self._component("cpu", lambda: CPU(self.logger))
+
+    @property
+    def disk(self) -> Disk:
+        """Disk component."""
+        return self._component("disk", lambda: Disk(self.logger))
+
+    @property
+    def gpu(self) -> GPU:
+        """GPU component."""
+        return self._component("gpu", lambda: GPU(self.logger))
+
+    @property
+    def ram(self) -> RAM:
+        """RAM component."""
+        return self._component("ram", lambda: RAM(self.logger))
+
+    @property
+    def motherboard(self) -> Motherboard:
+        """Motherboard component."""
+        return self._component(
+            "motherboard", lambda: Motherboard(self.logger)
+        )
+
+    @property
+    def bios(self) -> BIOS:
+        """BIOS component."""
+        return self._component("bios", lambda: BIOS(self.logger))
+
+    @property
+    def network(self) -> Network:
+        """Network component."""
+        return self._component("network", lambda: Network(self.logger))
+
+    def submit_all(self, detailed: bool = False, components=None) -> dict[str, Future]:
+        """Start fetching the summary or details of several components concurrently.
+
+        Args:
+            detailed (bool): Fetch detailed information instead of summaries.
+            components (Iterable[str], optional): Names of the components to
+                fetch. All components are fetched, in report order, if omitted.
+
+        Returns:
+            dict[str, Future]: Futures of the fetched information keyed by
+                component name, in the requested order.
+        """
+        names = _COMPONENT_NAMES if components is None else components
+        return {
+            name: self._worker(name).submit(self._fetch, name, detailed)
+            for name in names
+        }
+
+    def gather_all(self, detailed: bool = False, components=None) -> dict[str, str]:
+        """Fetch the summary or details of several components concurrently.
+
+        Args:
+            detailed (bool): Fetch detailed information instead of summaries.
+            components (Iterable[str], optional): Names of the components to
+                fetch. All components are fetched, in report order, if omitted.
+
+        Returns:
+            dict[str, str]: Fetched information keyed by component name, in
+                the requested order.
+        """
+        futures = self.submit_all(detailed, components)
+        return {name: future.result() for name, future in futures.items()}
+
+    def _worker(self, name: str) -> ComWorker:
+        """Return the worker thread of a component, starting it on first use."""
+        worker = self._workers.get(name)
+        if worker is None:
+            worker = ComWorker(f"noctua-{name}")
+            self._workers[name] = worker
+        return worker
+
+    def _fetch(self, name: str, detailed: bool) -> str:
+        """Fetch the summary or details of a component on its worker thread."""
+        component = getattr(self, name)
+        return component.get_details() if detailed else component.get_summary()
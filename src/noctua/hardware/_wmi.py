@@ -0,0 +1,158 @@
+"""
+Shared WMI connection and query cache.
+
+Opening a WMI connection initializes COM and binds to the CIMV2 namespace,
+which is slow. This module hands out a single connection that all hardware
+components reuse. WMI objects cannot be used outside the COM apartment of the
+thread that created them, so the connection is shared per thread, and
+ComWorker provides long-lived COM threads that components can stay on.
+"""
+
+import queue
+import threading
+from concurrent.futures import Future
+import pythoncom
+import wmi
+
+_local = threading.local()
+
+# Win32_PnPEntity columns used by the hardware components
+_PNP_ENTITY_PROPERTIES = ("Name", "Manufacturer", "DeviceID")
+
+
+def get_wmi():
+    """Return the WMI connection of the calling thread, opening it on first use.
+
+    Returns:
+        wmi.WMI: WMI connection for the current thread.
+    """
+    connection = getattr(_local, "connection", None)
+    if connection is None:
+        connection = wmi.WMI()
+        _local.connection = connection
+    return connection
+
+
+def get_wmi_cache():
+    """Return the WMI query cache of the calling thread, creating it on first use.
+
+    Returns:
+        WmiCache: Query cache bound to the WMI connection of the current thread.
+    """
+    cache = getattr(_local, "cache", None)
+    if cache is None:
+        cache = WmiCache()
+        _local.cache = cache
+    return cache
+
+
+class ComWorker:
+    """Daemon thread with an initialized COM apartment that runs calls in order.
+
+    Everything submitted to one worker runs on the same thread, so WMI objects
+    created by an earlier call stay usable in later ones. The thread is a
+    daemon and does not keep the process alive at exit.
+    """
+
+    def __init__(self, name: str):
+        """Start the worker thread.
+
+        Args:
+            name (str): Name of the worker thread.
+        """
+        self._tasks = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, fn, *args) -> Future:
+        """Queue fn(*args) on the worker thread.
+
+        Returns:
+            Future: Future receiving the result or exception of the call.
+        """
+        future = Future()
+        self._tasks.put((future, fn, args))
+        return future
+
+    def _run(self):
+        """Initialize COM for the thread and execute queued calls forever."""
+        pythoncom.CoInitialize()
+        while True:
+            future, fn, args = self._tasks.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args)
+            except BaseException as error:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+
+class WmiCache:
+    """Memoized WMI query results shared by the hardware components of a thread.
+
+    Hardware inventory does not change during a run, so each distinct WQL query
+    is sent to WMI only once. The connection is opened on the first query.
+    """
+
+    def __init__(self):
+        """Initialize an empty cache bound to the current thread's WMI connection."""
+        self._connection = None
+        self._results = {}
+
+    @property
+    def connection(self):
+        """WMI connection used for the queries, opened on first access."""
+        if self._connection is None:
+            self._connection = get_wmi()
+        return self._connection
+
+    def query(self, wql: str, fields=()) -> list:
+        """Run a WQL query once and return the cached rows on later calls.
+
+        The wmi package already runs queries with forward-only, return-immediately
+        enumerators. Passing the selected fields also keeps it from walking the
+        full property list of every returned object.
+
+        Args:
+            wql (str): WQL query to run.
+            fields (Iterable[str], optional): Properties selected by the query.
+
+        Returns:
+            list: Result rows of the query.
+        """
+        rows = self._results.get(wql)
+        if rows is None:
+            rows = self.connection.query(wql, fields=list(fields))
+            self._results[wql] = rows
+        return rows
+
+    def select(self, cls_name: str, properties: tuple, where: str = None) -> list:
+        """Return the instances of a WMI class with only the given properties.
+
+        Args:
+            cls_name (str): Name of the WMI class, e.g. "Win32_BaseBoard".
+            properties (tuple): Names of the properties to select.
+            where (str, optional): WQL condition the instances must satisfy.
+
+        Returns:
+            list: Cached instances of the WMI class.
+        """
+        wql = f"SELECT {', '.join(properties)} FROM {cls_name}"
+        if where is not None:
+            wql += f" WHERE {where}"
+        return self.query(wql, fields=properties)
+
+    def pnp_entities(self, name_like: str = None) -> list:
+        """Return Plug and Play entities with their name, manufacturer and device ID.
+
+        Args:
+            name_like (str, optional): WQL LIKE pattern the entity name must
+                match. All entities are returned if omitted.
+
+        Returns:
+            list: Matching Win32_PnPEntity rows.
+        """
+        where = f"Name LIKE '{name_like}'" if name_like is not None else None
+        return self.select("Win32_PnPEntity", _PNP_ENTITY_PROPERTIES, where)
@@ -7,6 +7,60 @@ return information about the BIOS.
 
 import logging
 import wmi
+from ._wmi import get_wmi_cache
+
+# BIOS characteristic descriptions, indexed by characteristic code.
+_BIOS_CHAR = (
+    "Reserved",
+    "BIOS Characteristics Not Supported",
+    "ISA is supported",
+    "MCA is supported",
+    "EISA is supported",
+    "PCI is supported",
+    "PC Card (PCMCIA) is supported",
+    "Plug and Play is supported",
+    "APM is supported",
+    "BIOS is upgradeable",
+    "BIOS shadowing is allowed",
+    "VLB is supported",
+    "ESCD support is available",
+    "Boot from CD is supported",
+    "Selectable Boot is supported",
+    "BIOS ROM is socketed",
+    "Boot from PCMCIA is supported",
+    "EDD is supported",
+    "Print screen service is supported",
+    "8042 keyboard services are supported",
+    "Serial services are supported",
+    "Printer services are supported",
+    "CGA/Mono video services are supported",
+    "NEC PC-98",
+    "ACPI is supported",
+    "USB legacy is supported",
+    "AGP is supported",
+    "I2O boot is supported",
+    "LS-120 boot is supported",
+    "ATAPI ZIP drive boot is supported",
+    "1394 boot is supported",
+    "Smart battery is supported",
+    "BIOS Boot Specification is supported",
+    "Function key-initiated network boot is supported",
+    "Targeted content distribution is supported",
+    "UEFI is supported",
+)
+_BIOS_CHAR_LEN = len(_BIOS_CHAR)
+
+# Win32_BIOS properties read by this module
+_BIOS_PROPERTIES = (
+    "Manufacturer",
+    "SMBIOSBIOSVersion",
+    "ReleaseDate",
+    "SMBIOSMajorVersion",
+    "SMBIOSMinorVersion",
+    "BIOSCharacteristics",
+    "CurrentLanguage",
+    "PrimaryBIOS",
+)
 
 
 class BIOS:
@@ -19,7 +73,10 @@ class BIOS:
             logger (logging.Logger): Logger instance for logging.
         """
         self.logger = logger
-        self.wmi = wmi.WMI()
+        self.cache = get_wmi_cache()
+        # BIOS data does not change at runtime, so it is queried only once.
+        self._summary_cache = None
+        self._details_cache = None
 
     def get_summary(self) -> str:
         """Fetch a summary of the BIOS information.
@@ -61,13 +118,15 @@ class BIOS:
         Returns:
             str: BIOS summary.
         """
-        bios_info = ""
-        for bios in self.wmi.Win32_BIOS():
-            bios_info = (
-                f"**Manufacturer:** {bios.Manufacturer}\n"
-                f"**Version:** {bios.SMBIOSBIOSVersion}\n"
-            )
-        return bios_info
+        if self._summary_cache is None:
+            bios_info = ""
+            for bios in self.cache.select("Win32_BIOS", _BIOS_PROPERTIES):
+                bios_info = (
+                    f"**Manufacturer:** {bios.Manufacturer}\n"
+                    f"**Version:** {bios.SMBIOSBIOSVersion}\n"
+                )
+            self._summary_cache = bios_info
+        return self._summary_cache
 
     def _fetch_bios_details(self) -> str:
         """Internal method to fetch detailed BIOS information.
@@ -75,20 +134,41 @@ class BIOS:
         Returns:
             str: Detailed BIOS information.
         """
-        details = ""
-        for bios_entry in self.wmi.Win32_BIOS():
-            details += (
-                f"**Manufacturer:** {bios_entry.Manufacturer}\n"
-                f"**Version:** {bios_entry.SMBIOSBIOSVersion}\n"
-                f"**Release Date:** {self._format_date(bios_entry.ReleaseDate)}\n"
-                f"**SMBIOS Version:** {bios_entry.SMBIOSMajorVersion}."
-                f"{bios_entry.SMBIOSMinorVersion}\n"
-                f"**BIOS Characteristics:** "
-                f"{self._get_bios_characteristics(bios_entry.BIOSCharacteristics)}\n"
-                f"**BIOS Language:** {bios_entry.CurrentLanguage}\n"
-                f"**Primary BIOS:** {'Yes' if bios_entry.PrimaryBIOS else 'No'}\n"
-            )
-        return details
+        if self._details_cache is None:
+            parts = []
+            for bios_entry in self.cache.select("Win32_BIOS", _BIOS_PROPERTIES):
+                # Read each COM property once before formatting
+                (
+                    manufacturer,
+                    version,
+                    release_date,
+                    smbios_major,
+                    smbios_minor,
+                    characteristics,
+                    language,
+                    primary,
+                ) = (
+                    bios_entry.Manufacturer,
+                    bios_entry.SMBIOSBIOSVersion,
+                    bios_entry.ReleaseDate,
+                    bios_entry.SMBIOSMajorVersion,
+                    bios_entry.SMBIOSMinorVersion,
+                    bios_entry.BIOSCharacteristics,
+                    bios_entry.CurrentLanguage,
+                    bios_entry.PrimaryBIOS,
+                )
+                parts.append(
+                    f"**Manufacturer:** {manufacturer}\n"
+                    f"**Version:** {version}\n"
+                    f"**Release Date:** {self._format_date(release_date)}\n"
+                    f"**SMBIOS Version:** {smbios_major}.{smbios_minor}\n"
+                    f"**BIOS Characteristics:** "
+                    f"{self._get_bios_characteristics(characteristics)}\n"
+                    f"**BIOS Language:** {language}\n"
+                    f"**Primary BIOS:** {'Yes' if primary else 'No'}\n"
+                )
+            self._details_cache = "".join(parts)
+        return self._details_cache
 
     def _format_date(self, date_str: str) -> str:
         """Format the BIOS release date.
@@ -101,7 +181,7 @@ class BIOS:
         """
         if not date_str:
             return "Unknown"
-        return f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}"
+        return "-".join((date_str[:4], date_str[4:6], date_str[6:8]))
 
     def _get_bios_characteristics(self, characteristics: list) -> str:
         """Convert BIOS characteristics codes to human-readable string.
@@ -112,44 +192,9 @@ class BIOS:
         Returns:
             str: Human-readable BIOS characteristics.
         """
-        characteristic_descriptions = {
-            0: "Reserved",
-            1: "BIOS Characteristics Not Supported",
-            2: "ISA is supported",
-            3: "MCA is supported",
-            4: "EISA is supported",
-            5: "PCI is supported",
-            6: "PC Card (PCMCIA) is supported",
-            7: "Plug and Play is supported",
-            8: "APM is supported",
-            9: "BIOS is upgradeable",
-            10: "BIOS shadowing is allowed",
-            11: "VLB is supported",
-            12: "ESCD support is available",
-            13: "Boot from CD is supported",
-            14: "Selectable Boot is supported",
-            15: "BIOS ROM is socketed",
-            16: "Boot from PCMCIA is supported",
-            17: "EDD is supported",
-            18: "Print screen service is supported",
-            19: "8042 keyboard services are supported",
-            20: "Serial services are supported",
-            21: "Printer services are supported",
-            22: "CGA/Mono video services are supported",
-            23: "NEC PC-98",
-            24: "ACPI is supported",
-            25: "USB legacy is supported",
-            26: "AGP is supported",
-            27: "I2O boot is supported",
-            28: "LS-120 boot is supported",
-            29: "ATAPI ZIP drive boot is supported",
-            30: "1394 boot is supported",
-            31: "Smart battery is supported",
-            32: "BIOS Boot Specification is supported",
-            33: "Function key-initiated network boot is supported",
-            34: "Targeted content distribution is supported",
-            35: "UEFI is supported",
-        }
         return ", ".join(
-            characteristic_descriptions.get(char, "Unknown") for char in characteristics
+            [
+                _BIOS_CHAR[char] if 0 <= char < _BIOS_CHAR_LEN else "Unknown"
+                for char in characteristics
+            ]
         )
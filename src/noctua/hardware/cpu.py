@@ -22,6 +22,16 @@ class CPU:
         """
         self.logger = logger
         self.cpu_info = cpuinfo.get_cpu_info()
+        # Core and thread counts are fixed for the lifetime of the process
+        self._cores = psutil.cpu_count(logical=False)
+        self._threads = psutil.cpu_count(logical=True)
+        # Only the frequency changes between summaries; the rest is formatted once
+        self._summary_head = (
+            f"**Name:** {self._get_cpu_name()}\n"
+            f"**Cores:** {self._get_cores_count()}\n"
+            f"**Threads:** {self._get_threads_count()}\n"
+        )
+        self._summary_tail = f"**Architecture:** {self._get_architecture()}\n"
 
     def get_summary(self) -> str:
         """
@@ -32,21 +42,14 @@ class CPU:
         """
         self.logger.info("Fetching CPU summary (Light version).")
 
-        name = self._get_cpu_name()
-        cores = self._get_cores_count()
-        threads = self._get_threads_count()
-        arch = self._get_architecture()
-
         # Wir können optional psutil.cpu_freq() verwenden, um den aktuellen CPU-Takt auszulesen.
         freqs = psutil.cpu_freq()
         frequency_mhz = f"{freqs.current:.1f}" if freqs else "Unknown"
 
         return (
-            f"**Name:** {name}\n"
-            f"**Cores:** {cores}\n"
-            f"**Threads:** {threads}\n"
-            f"**Base Frequency:** {frequency_mhz} MHz\n"
-            f"**Architecture:** {arch}\n"
+            self._summary_head
+            + f"**Base Frequency:** {frequency_mhz} MHz\n"
+            + self._summary_tail
         )
 
     def get_details(self) -> str:
@@ -61,28 +64,24 @@ class CPU:
 
     def _get_cpu_name(self) -> str:
         """
-        Fetch the CPU brand/name from cpuinfo.
+        Return the CPU brand/name from cpuinfo.
         """
-        self.logger.debug("Fetching CPU name")
         return self.cpu_info.get("brand_raw", "Unknown")
 
     def _get_architecture(self) -> str:
         """
-        Fetch the CPU architecture from cpuinfo (e.g. x86_64, ARM).
+        Return the CPU architecture from cpuinfo (e.g. x86_64, ARM).
         """
-        self.logger.debug("Fetching CPU architecture")
         return self.cpu_info.get("arch", "Unknown")
 
     def _get_cores_count(self) -> int:
         """
-        Fetch the number of physical CPU cores.
+        Return the number of physical CPU cores.
         """
-        self.logger.debug("Fetching CPU cores count")
-        return psutil.cpu_count(logical=False)
+        return self._cores
 
     def _get_threads_count(self) -> int:
         """
-        Fetch the total number of logical processors/threads.
+        Return the total number of logical processors/threads.
         """
-        self.logger.debug("Fetching CPU threads count")
-        return psutil.cpu_count(logical=True)
+        return self._threads
@@ -1,12 +1,15 @@
 """
 Disk Module for fetching disk-related information (Light version).
 
-Uses psutil (and optionally wmi) to gather and return minimal disk information.
+Uses psutil to gather and return minimal disk information.
 """
 
 import logging
 import psutil
-import wmi
+
+# Factor converting bytes to GiB
+_INV_GB = 1.0 / (1 << 30)
+
 
 class Disk:
     """Class representing the Disk component (Light version)."""
@@ -18,7 +21,9 @@ class Disk:
             logger (logging.Logger): Logger instance for logging.
         """
         self.logger = logger
-        self.wmi = wmi.WMI()
+        # Partition snapshot, taken on the first summary inside its error handling
+        self._partitions = None
+        self._usage_cache = {}
 
     def get_summary(self) -> str:
         """
@@ -30,9 +35,6 @@ class Disk:
         try:
             self.logger.info("Fetching disk summary (Light version).")
             return self._fetch_disk_summary()
-        except wmi.x_wmi:
-            self.logger.error("Failed to fetch disk summary", exc_info=True)
-            return "**Disk Information**\nFailed to fetch disk summary.\n"
         except Exception:
             self.logger.error("An unexpected error occurred (disk summary).", exc_info=True)
             return "**Disk Information**\nAn unexpected error occurred.\n"
@@ -47,27 +49,49 @@ class Disk:
         """
         Internal method to fetch a short disk summary for each partition.
         """
-        partitions = psutil.disk_partitions()
-        summary = ""
-        device_counter = 0
-
-        for partition in partitions:
-            # Skip CD-ROMs or empty fstype
-            if "cdrom" in partition.opts or partition.fstype == "":
-                continue
-
-            device_counter += 1
-            usage = psutil.disk_usage(partition.mountpoint)
-            summary += (
-                f"**Device {device_counter}:**\n"
+        parts = []
+        for device_number, partition, usage in self._iter_usable_partitions():
+            parts.append(
+                f"**Device {device_number}:**\n"
                 f"- **Path:** {partition.device}\n"
                 f"- **Total Size:** {self._bytes_to_gb(usage.total)} GB\n\n"
             )
 
-        return summary if summary else "No disk partitions found."
+        return "".join(parts) if parts else "No disk partitions found."
+
+    def _iter_usable_partitions(self):
+        """
+        Yield (device number, partition, usage) for each reportable partition.
+        """
+        for device_number, partition in enumerate(self._get_partitions(), start=1):
+            yield device_number, partition, self._usage(partition.mountpoint)
+
+    def _get_partitions(self) -> list:
+        """
+        Return the reportable partitions, listing them only once.
+        CD-ROMs and partitions without a filesystem are skipped.
+        """
+        if self._partitions is None:
+            self._partitions = [
+                partition
+                for partition in psutil.disk_partitions()
+                if partition.fstype and "cdrom" not in partition.opts.split(",")
+            ]
+        return self._partitions
+
+    def _usage(self, mountpoint: str):
+        """
+        Return the disk usage of a mountpoint, querying it only once.
+        """
+        usage = self._usage_cache.get(mountpoint)
+        if usage is None:
+            usage = psutil.disk_usage(mountpoint)
+            self._usage_cache[mountpoint] = usage
+        return usage
 
-    def _bytes_to_gb(self, bytes_value: int) -> float:
+    @staticmethod
+    def _bytes_to_gb(bytes_value: int) -> float:
         """
         Convert bytes to gigabytes.
         """
-        return round(bytes_value / (1024**3), 2)
+        return round(bytes_value * _INV_GB, 2)
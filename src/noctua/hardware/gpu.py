@@ -2,15 +2,59 @@
 GPU Module for fetching GPU related information (Light version).
 
 This module defines the GPU class that can gather
-basic GPU details using py3nvml, wmi, and pyopencl.
+basic GPU details using py3nvml, wmi, and pyopencl. The py3nvml and pyopencl
+drivers are imported on first use, and a missing driver simply reports no GPU
+of that kind.
 In the Light version, only a short summary is provided.
 """
 
+import atexit
+import functools
 import logging
-import subprocess
-from py3nvml import py3nvml as nvml
+from concurrent.futures import ThreadPoolExecutor
 import wmi
-import pyopencl as cl
+from ._wmi import get_wmi_cache
+
+_MB = 1 << 20
+
+# Static OpenCL device attributes keyed by (platform pointer, device pointer)
+_CL_DEVICE_INFO: dict[tuple[int, int], dict] = {}
+
+# Win32_VideoController properties read by this module
+_VIDEO_CONTROLLER_PROPERTIES = (
+    "Name",
+    "AdapterCompatibility",
+    "AdapterRAM",
+    "PNPDeviceID",
+)
+
+# PCI vendor ID of NVIDIA as it appears in PnP device IDs
+_NVIDIA_PNP_VENDOR = "VEN_10DE"
+
+
+@functools.lru_cache(maxsize=None)
+def _import_nvml():
+    """Import py3nvml on first use, returning None if it is not installed."""
+    try:
+        from py3nvml import py3nvml as nvml
+    except ImportError:
+        return None
+    return nvml
+
+
+@functools.lru_cache(maxsize=None)
+def _import_cl():
+    """Import pyopencl on first use, returning None if it cannot be loaded."""
+    try:
+        import pyopencl as cl
+    except ImportError:
+        return None
+    return cl
+
+
+def _as_str(value) -> str:
+    """Return NVML string results as str; older py3nvml versions return bytes."""
+    return value.decode("utf-8") if isinstance(value, bytes) else value
 
 
 class GPU:
@@ -24,7 +68,15 @@ class GPU:
             logger (logging.Logger): Logger instance for logging.
         """
         self.logger = logger
-        self.wmi = wmi.WMI()
+        self.cache = get_wmi_cache()
+        self._nvml_ready = False
+        self._nvml_handles = []
+        # (bus, device) PCI locations of the GPUs reported by NVML
+        self._nvidia_pci_locations: set[tuple[int, int]] = set()
+        # Static NVML device attributes keyed by device index
+        self._static_cache: dict[int, dict] = {}
+        self._init_nvml()
+        self._has_nvidia = self._nvml_ready
 
     def get_summary(self) -> str:
         """
@@ -34,29 +86,20 @@ class GPU:
             str: Summary text listing integrated GPU, OpenCL GPU, and/or NVIDIA GPU info.
         """
         self.logger.info("Fetching GPU summary (Light version).")
-        summary_sections = []
-
-        # Integrierte GPU
-        if self.has_integrated_gpu():
-            self.logger.debug("Detected integrated GPU.")
-            integrated_summary = self._fetch_integrated_gpu_info_summary()
-            if integrated_summary.strip():
-                summary_sections.append(integrated_summary)
-
-        # OpenCL
-        if self.has_opencl_gpu():
-            self.logger.debug("Detected OpenCL-compatible GPU.")
-            opencl_summary = self._fetch_opencl_gpu_info_summary()
-            if opencl_summary.strip():
-                summary_sections.append(opencl_summary)
-
-        # NVIDIA
-        if self.is_nvidia_smi_available():
-            self.logger.debug("NVIDIA SMI found.")
-            nvidia_summary = self._fetch_nvidia_gpu_info_summary()
-            if nvidia_summary.strip():
-                summary_sections.append(nvidia_summary)
 
+        # OpenCL and NVML probes are independent and driver-bound, so they run
+        # concurrently. The WMI probe stays on the calling thread because WMI
+        # objects cannot be used outside the thread that created them.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            opencl_future = executor.submit(self._summarize_opencl_gpu)
+            nvidia_future = executor.submit(self._summarize_nvidia_gpu)
+            sections = [
+                self._summarize_integrated_gpu(),
+                opencl_future.result(),
+                nvidia_future.result(),
+            ]
+
+        summary_sections = [section for section in sections if section.strip()]
         if not summary_sections:
             return "**GPU Information**\nNo supported GPU found.\n"
 
@@ -69,43 +112,106 @@ class GPU:
         """
         return ""
 
+    def _init_nvml(self):
+        """Initialize NVML once and resolve the handles of all NVIDIA devices."""
+        nvml = _import_nvml()
+        if nvml is None:
+            self.logger.debug("py3nvml is not installed.")
+            return
+        try:
+            nvml.nvmlInit()
+        except nvml.NVMLError:
+            self.logger.debug("NVML is not available.")
+            return
+        self._nvml_ready = True
+        atexit.register(nvml.nvmlShutdown)
+        try:
+            self._nvml_handles = [
+                nvml.nvmlDeviceGetHandleByIndex(i)
+                for i in range(nvml.nvmlDeviceGetCount())
+            ]
+            for handle in self._nvml_handles:
+                pci_info = nvml.nvmlDeviceGetPciInfo(handle)
+                self._nvidia_pci_locations.add((pci_info.bus, pci_info.device))
+        except nvml.NVMLError as error:
+            # Not fatal: the summary falls back to the handles resolved so far
+            self.logger.warning("Failed to enumerate NVIDIA devices: %s", error)
+
     # -----------------------------------------------------------------
     # Hilfsmethoden: Prüfen, ob bestimmte GPU-Typen existieren
     # -----------------------------------------------------------------
     def has_integrated_gpu(self) -> bool:
         """Check if the system has an integrated GPU via WMI."""
         try:
-            return bool(self.wmi.Win32_VideoController())
+            return bool(
+                self.cache.select("Win32_VideoController", _VIDEO_CONTROLLER_PROPERTIES)
+            )
         except wmi.x_wmi:
             return False
 
     def has_opencl_gpu(self) -> bool:
         """Check if the system has an OpenCL-compatible GPU."""
+        return bool(self._cl_devices)
+
+    @functools.cached_property
+    def _cl_devices(self) -> list:
+        """(platform, device) pairs of all OpenCL devices, enumerated once."""
+        cl = _import_cl()
+        if cl is None:
+            return []
         try:
-            platforms = cl.get_platforms()
-            return any(platform.get_devices() for platform in platforms)
-        except cl.LogicError:
-            return False
+            return [
+                (platform, device)
+                for platform in cl.get_platforms()
+                for device in platform.get_devices()
+            ]
+        except cl.LogicError as error:
+            # Raised as PLATFORM_NOT_FOUND_KHR when no OpenCL driver is installed
+            self.logger.debug("No OpenCL devices available: %s", error)
+            return []
 
     def is_nvidia_smi_available(self) -> bool:
-        """Check if NVIDIA SMI is available."""
-        try:
-            subprocess.check_output(["nvidia-smi"])
-            return True
-        except (FileNotFoundError, subprocess.CalledProcessError):
-            return False
+        """Check if the NVIDIA driver is available, based on the one-time NVML init."""
+        return self._has_nvidia
 
     # -----------------------------------------------------------------
     # Summaries für integrierte, OpenCL und NVIDIA GPUs
     # -----------------------------------------------------------------
+    def _summarize_integrated_gpu(self) -> str:
+        """Return the integrated GPU summary, or an empty string if there is none."""
+        if not self.has_integrated_gpu():
+            return ""
+        self.logger.debug("Detected integrated GPU.")
+        return self._fetch_integrated_gpu_info_summary()
+
+    def _summarize_opencl_gpu(self) -> str:
+        """Return the OpenCL GPU summary, or an empty string if there is none."""
+        if not self.has_opencl_gpu():
+            return ""
+        self.logger.debug("Detected OpenCL-compatible GPU.")
+        return self._fetch_opencl_gpu_info_summary()
+
+    def _summarize_nvidia_gpu(self) -> str:
+        """Return the NVIDIA GPU summary, or an empty string if there is none."""
+        if not self.is_nvidia_smi_available():
+            return ""
+        self.logger.debug("NVIDIA SMI found.")
+        return self._fetch_nvidia_gpu_info_summary()
+
     def _fetch_integrated_gpu_info_summary(self) -> str:
         """Fetch a summary of the integrated GPU information using WMI."""
         summary_lines = []
         try:
-            for gpu in self.wmi.Win32_VideoController():
+            video_controllers = self.cache.select(
+                "Win32_VideoController", _VIDEO_CONTROLLER_PROPERTIES
+            )
+            for gpu in video_controllers:
+                # NVIDIA GPUs are already listed with their NVML data
+                if self._nvml_handles and _NVIDIA_PNP_VENDOR in (gpu.PNPDeviceID or ""):
+                    continue
                 # VRAM in MB
                 if gpu.AdapterRAM and int(gpu.AdapterRAM) >= 0:
-                    vram = int(gpu.AdapterRAM) / 1024 / 1024
+                    vram = int(gpu.AdapterRAM) / _MB
                     summary_lines.append(
                         f"**Name:** {gpu.Name}\n"
                         f"**Manufacturer:** {gpu.AdapterCompatibility}\n"
@@ -122,47 +228,88 @@ class GPU:
 
     def _fetch_opencl_gpu_info_summary(self) -> str:
         """Fetch a summary of the OpenCL GPU information."""
+        cl = _import_cl()
         summary_lines = []
         try:
-            platforms = cl.get_platforms()
-            for platform in platforms:
-                devices = platform.get_devices()
-                for device in devices:
-                    vram_mb = device.global_mem_size / 1024 / 1024
-                    if vram_mb >= 0:
-                        summary_lines.append(
-                            f"**Name:** {device.name}\n"
-                            f"**Manufacturer:** {device.vendor}\n"
-                            f"**VRAM:** {vram_mb:.1f} MB\n"
-                        )
-                    else:
-                        summary_lines.append(
-                            f"**Name:** {device.name}\n"
-                            f"**Manufacturer:** {device.vendor}\n"
-                        )
+            for platform, device in self._cl_devices:
+                info = self._opencl_static_info(platform, device)
+                # NVIDIA GPUs are already listed with their NVML data
+                if info["pci_location"] in self._nvidia_pci_locations:
+                    continue
+                if info["vram_mb"] >= 0:
+                    summary_lines.append(
+                        f"**Name:** {info['name']}\n"
+                        f"**Manufacturer:** {info['vendor']}\n"
+                        f"**VRAM:** {info['vram_mb']:.1f} MB\n"
+                    )
+                else:
+                    summary_lines.append(
+                        f"**Name:** {info['name']}\n"
+                        f"**Manufacturer:** {info['vendor']}\n"
+                    )
         except cl.LogicError:
             self.logger.error("Failed to fetch OpenCL GPU summary", exc_info=True)
         return "\n".join(summary_lines)
 
     def _fetch_nvidia_gpu_info_summary(self) -> str:
         """Fetch a summary of the NVIDIA GPU information using NVML."""
+        if not self._nvml_ready:
+            return ""
+        nvml = _import_nvml()
         summary_lines = []
         try:
-            nvml.nvmlInit()
-            device_count = nvml.nvmlDeviceGetCount()
-            for i in range(device_count):
-                handle = nvml.nvmlDeviceGetHandleByIndex(i)
-                name = nvml.nvmlDeviceGetName(handle).decode("utf-8")
-                mem_info = nvml.nvmlDeviceGetMemoryInfo(handle)
-                vram_mb = mem_info.total / 1024 / 1024
+            for index in range(len(self._nvml_handles)):
+                info = self._nvidia_static_info(index)
                 summary_lines.append(
-                    f"**Name:** {name}\n"
+                    f"**Name:** {info['name']}\n"
                     f"**Manufacturer:** NVIDIA\n"
-                    f"**VRAM:** {vram_mb:.1f} MB\n"
+                    f"**VRAM:** {info['vram_mb']:.1f} MB\n"
                 )
-            nvml.nvmlShutdown()
         except nvml.NVMLError as error:
             self.logger.error(
                 "Failed to fetch NVIDIA GPU summary: %s", error, exc_info=True
             )
         return "\n".join(summary_lines)
+
+    # -----------------------------------------------------------------
+    # Statische Geräteattribute, die sich zur Laufzeit nicht ändern
+    # -----------------------------------------------------------------
+    def _nvidia_static_info(self, index: int) -> dict:
+        """Return the static attributes of an NVIDIA device, querying NVML once."""
+        info = self._static_cache.get(index)
+        if info is None:
+            nvml = _import_nvml()
+            handle = self._nvml_handles[index]
+            info = {
+                "name": _as_str(nvml.nvmlDeviceGetName(handle)),
+                "vram_mb": nvml.nvmlDeviceGetMemoryInfo(handle).total / _MB,
+            }
+            self._static_cache[index] = info
+        return info
+
+    def _opencl_static_info(self, platform, device) -> dict:
+        """Return the static attributes of an OpenCL device, querying the driver once."""
+        key = (platform.int_ptr, device.int_ptr)
+        info = _CL_DEVICE_INFO.get(key)
+        if info is None:
+            info = {
+                "name": device.name,
+                "vendor": device.vendor,
+                "vram_mb": device.global_mem_size / _MB,
+                "pci_location": self._opencl_pci_location(device),
+            }
+            _CL_DEVICE_INFO[key] = info
+        return info
+
+    def _opencl_pci_location(self, device):
+        """Return the (bus, device) PCI location of an NVIDIA OpenCL device, else None."""
+        if "cl_nv_device_attribute_query" not in device.extensions:
+            return None
+        cl = _import_cl()
+        try:
+            bus = device.get_info(cl.device_info.PCI_BUS_ID_NV)
+            slot = device.get_info(cl.device_info.PCI_SLOT_ID_NV)
+        except cl.Error:
+            return None
+        # The slot ID packs the PCI device number above the 3 function bits
+        return bus, slot >> 3
@@ -7,6 +7,10 @@ to gather and return only summarized information about the motherboard.
 
 import logging
 import wmi
+from ._wmi import get_wmi_cache
+
+# Win32_BaseBoard properties read by this module
+_BASEBOARD_PROPERTIES = ("Manufacturer", "Product")
 
 
 class Motherboard:
@@ -20,7 +24,7 @@ class Motherboard:
             logger (logging.Logger): Logger instance for logging.
         """
         self.logger = logger
-        self.wmi = wmi.WMI()
+        self.cache = get_wmi_cache()
 
     def get_summary(self) -> str:
         """
@@ -30,7 +34,7 @@ class Motherboard:
             str: Summary of the motherboard information.
         """
         try:
-            self.logger.info("Fetching motherboard summary (Light version)")
+            self.logger.debug("Fetching motherboard summary (Light version)")
             return self._fetch_motherboard_summary()
         except wmi.x_wmi:
             self.logger.error("Failed to fetch motherboard summary", exc_info=True)
@@ -56,13 +60,13 @@ class Motherboard:
             str: Summary of the motherboard's key details.
         """
         try:
-            summary = ""
-            for board in self.wmi.Win32_BaseBoard():
-                summary += (
+            parts = []
+            for board in self.cache.select("Win32_BaseBoard", _BASEBOARD_PROPERTIES):
+                parts.append(
                     f"**Manufacturer:** {board.Manufacturer}\n"
                     f"**Product:** {board.Product}\n"
                 )
-            return summary if summary else "**Motherboard Information**\nNo data available.\n"
+            return "".join(parts) if parts else "**Motherboard Information**\nNo data available.\n"
         except wmi.x_wmi:
             self.logger.error("Failed to fetch motherboard summary", exc_info=True)
             return "**Failed to fetch motherboard summary**"
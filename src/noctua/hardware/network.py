@@ -30,7 +30,7 @@ class Network:
             str: Summary of the network interfaces and their addresses.
         """
         try:
-            self.logger.info("Fetching network summary (Light version)")
+            self.logger.debug("Fetching network summary (Light version)")
             return self._fetch_network_summary()
         except Exception:
             self.logger.error("Failed to fetch network summary", exc_info=True)
@@ -53,17 +53,17 @@ class Network:
             str: Summary of the network interfaces and their addresses.
         """
         addrs = psutil.net_if_addrs()
-        summary = ""
+        parts = []
         for interface, addr_list in addrs.items():
-            summary += f"**Interface:** {interface}\n"
+            parts.append(f"**Interface:** {interface}\n")
             for addr in addr_list:
                 addr_type = self._get_address_type(addr.family)
                 if addr_type in {"IPv4", "IPv6"}:
-                    summary += f"- **{addr_type}:** {addr.address}\n"
+                    parts.append(f"- **{addr_type}:** {addr.address}\n")
                 elif addr_type == "MAC":
-                    summary += f"- **MAC Address:** {addr.address}\n"
-            summary += "\n"
-        return summary if summary else "**Network Information**\nNo data available.\n"
+                    parts.append(f"- **MAC Address:** {addr.address}\n")
+            parts.append("\n")
+        return "".join(parts) if parts else "**Network Information**\nNo data available.\n"
 
     def _get_address_type(self, family: int) -> str:
         """
@@ -7,12 +7,66 @@ to gather and return information about the RAM.
 
 import logging
 import psutil
-import wmi
+from ._wmi import get_wmi_cache
+
+# Factor converting bytes to GiB
+_INV_GB = 1.0 / (1 << 30)
+
+# Human-readable names of Win32_PhysicalMemory FormFactor codes
+_FORM_FACTORS = {
+    0: "Unknown",
+    8: "DIMM",
+    12: "SODIMM",
+}
+
+# Human-readable names of Win32_PhysicalMemory MemoryType codes
+_MEMORY_TYPES = {
+    0: "Unknown",
+    20: "DDR",
+    21: "DDR2",
+    24: "DDR3",
+    26: "DDR4",
+}
+
+# Win32_PhysicalMemory properties read by this module
+_PHYSICAL_MEMORY_PROPERTIES = (
+    "Capacity",
+    "Speed",
+    "ConfiguredClockSpeed",
+    "Manufacturer",
+    "SerialNumber",
+    "PartNumber",
+    "FormFactor",
+    "MemoryType",
+    "BankLabel",
+    "DataWidth",
+    "TotalWidth",
+    "MinVoltage",
+    "ConfiguredVoltage",
+)
 
 
 class RAM:
     """Class representing the RAM component."""
 
+    # Detail block of a single RAM module, filled via str.format_map
+    _RAM_MODULE_TEMPLATE = (
+        "- **Module {idx}:**\n"
+        "  - **Capacity:** {capacity} GB\n"
+        "  - **Speed:** {speed} MHz\n"
+        "  - **Configured Speed:** {configured_speed} MHz\n"
+        "  - **Manufacturer:** {manufacturer}\n"
+        "  - **Serial Number:** {serial_number}\n"
+        "  - **Part Number:** {part_number}\n"
+        "  - **Form Factor:** {form_factor}\n"
+        "  - **Memory Type:** {memory_type}\n"
+        "  - **Bank Label:** {bank_label}\n"
+        "  - **Data Width:** {data_width} bits\n"
+        "  - **Total Width:** {total_width} bits\n"
+        "  - **Voltage:** {voltage} V\n"
+        "  - **Configured Voltage:** {configured_voltage} V\n\n"
+    )
+
     def __init__(self, logger: logging.Logger):
         """
         Initialize the RAM class with a logger.
@@ -21,7 +75,7 @@ class RAM:
             logger (logging.Logger): Logger instance for logging.
         """
         self.logger = logger
-        self.wmi = wmi.WMI()
+        self.cache = get_wmi_cache()
 
     def get_summary(self) -> str:
         """
@@ -31,7 +85,7 @@ class RAM:
             str: Summary of the RAM information.
         """
         try:
-            self.logger.info("Fetching RAM summary")
+            self.logger.debug("Fetching RAM summary")
             return self._fetch_ram_summary()
         except Exception as e:
             self.logger.error("Failed to fetch RAM summary", exc_info=True)
@@ -45,7 +99,7 @@ class RAM:
             str: Detailed RAM information.
         """
         try:
-            self.logger.info("Fetching detailed RAM information")
+            self.logger.debug("Fetching detailed RAM information")
             return self._fetch_ram_details()
         except Exception as e:
             self.logger.error("Failed to fetch detailed RAM information", exc_info=True)
@@ -59,13 +113,16 @@ class RAM:
             str: Summary information for all RAM modules.
         """
         mem = psutil.virtual_memory()
-        summary = f"**Total Installed RAM:** {self.bytes_to_gb(mem.total)} GB\n**Modules:**\n"
-        for idx, module in enumerate(self.wmi.Win32_PhysicalMemory(), start=1):
-            summary += (
+        parts = [
+            f"**Total Installed RAM:** {self.bytes_to_gb(mem.total)} GB\n**Modules:**\n"
+        ]
+        modules = self.cache.select("Win32_PhysicalMemory", _PHYSICAL_MEMORY_PROPERTIES)
+        for idx, module in enumerate(modules, start=1):
+            parts.append(
                 f"- **Module {idx}:** {self.bytes_to_gb(int(module.Capacity))} GB, "
                 f"{module.Speed} MHz, Configured Speed: {self._format_value(module.Speed, module.ConfiguredClockSpeed)} MHz\n"
             )
-        return summary
+        return "".join(parts)
 
     def _fetch_ram_details(self) -> str:
         """
@@ -75,30 +132,39 @@ class RAM:
             str: Detailed RAM module information.
         """
         mem = psutil.virtual_memory()
-        details = (
+        parts = [
             f"**Total Installed RAM:** {self.bytes_to_gb(mem.total)} GB\n"
             f"**Used RAM:** {self.bytes_to_gb(mem.used)} GB\n"
             f"**Percentage Used:** {mem.percent}%\n\n"
             f"**Physical RAM Modules:**\n"
-        )
-        for idx, module in enumerate(self.wmi.Win32_PhysicalMemory(), start=1):
-            details += (
-                f"- **Module {idx}:**\n"
-                f"  - **Capacity:** {self.bytes_to_gb(int(module.Capacity))} GB\n"
-                f"  - **Speed:** {module.Speed} MHz\n"
-                f"  - **Configured Speed:** {self._format_value(module.Speed, module.ConfiguredClockSpeed)} MHz\n"
-                f"  - **Manufacturer:** {module.Manufacturer}\n"
-                f"  - **Serial Number:** {module.SerialNumber}\n"
-                f"  - **Part Number:** {module.PartNumber.strip()}\n"
-                f"  - **Form Factor:** {self._get_form_factor(module.FormFactor)}\n"
-                f"  - **Memory Type:** {self._get_memory_type(module.MemoryType)}\n"
-                f"  - **Bank Label:** {module.BankLabel}\n"
-                f"  - **Data Width:** {module.DataWidth} bits\n"
-                f"  - **Total Width:** {module.TotalWidth} bits\n"
-                f"  - **Voltage:** {self._format_voltage(module.MinVoltage)} V\n"
-                f"  - **Configured Voltage:** {self._format_voltage(module.ConfiguredVoltage)} V\n\n"
-            )
-        return details
+        ]
+        # Bind helpers once for the per-module loop
+        bytes_to_gb = self.bytes_to_gb
+        format_value = self._format_value
+        format_voltage = self._format_voltage
+        template = self._RAM_MODULE_TEMPLATE
+        modules = self.cache.select("Win32_PhysicalMemory", _PHYSICAL_MEMORY_PROPERTIES)
+        for idx, module in enumerate(modules, start=1):
+            row = {
+                "idx": idx,
+                "capacity": bytes_to_gb(int(module.Capacity)),
+                "speed": module.Speed,
+                "configured_speed": format_value(
+                    module.Speed, module.ConfiguredClockSpeed
+                ),
+                "manufacturer": module.Manufacturer,
+                "serial_number": module.SerialNumber,
+                "part_number": module.PartNumber.strip(),
+                "form_factor": _FORM_FACTORS.get(module.FormFactor, "Other"),
+                "memory_type": _MEMORY_TYPES.get(module.MemoryType, "Other"),
+                "bank_label": module.BankLabel,
+                "data_width": module.DataWidth,
+                "total_width": module.TotalWidth,
+                "voltage": format_voltage(module.MinVoltage),
+                "configured_voltage": format_voltage(module.ConfiguredVoltage),
+            }
+            parts.append(template.format_map(row))
+        return "".join(parts)
 
     def _format_value(self, expected_value: str, actual_value: str) -> str:
         """
@@ -129,42 +195,6 @@ class RAM:
             return f"{voltage / 1000:.2f}"
         return "N/A"
 
-    def _get_form_factor(self, form_factor_code: int) -> str:
-        """
-        Convert the form factor code to a human-readable string.
-
-        Args:
-            form_factor_code (int): Form factor code.
-
-        Returns:
-            str: Form factor description.
-        """
-        form_factors = {
-            0: "Unknown",
-            8: "DIMM",
-            12: "SODIMM",
-        }
-        return form_factors.get(form_factor_code, "Other")
-
-    def _get_memory_type(self, memory_type_code: int) -> str:
-        """
-        Convert the memory type code to a human-readable string.
-
-        Args:
-            memory_type_code (int): Memory type code.
-
-        Returns:
-            str: Memory type description.
-        """
-        memory_types = {
-            0: "Unknown",
-            20: "DDR",
-            21: "DDR2",
-            24: "DDR3",
-            26: "DDR4",
-        }
-        return memory_types.get(memory_type_code, "Other")
-
     def bytes_to_gb(self, bytes_value: int) -> float:
         """
         Convert bytes to gigabytes.
@@ -175,4 +205,4 @@ class RAM:
         Returns:
             float: Value in gigabytes.
         """
-        return round(bytes_value / (1024**3), 2)
+        return round(bytes_value * _INV_GB, 2)
@@ -5,12 +5,104 @@ This module defines the System class that uses various libraries
 to gather and return information about the system.
 """
 
+import functools
 import logging
 import platform
 import socket
 import ctypes
 from ctypes import wintypes
-import wmi
+from ._wmi import get_wmi_cache
+
+# Host and OS identification does not change while the process runs
+_HOSTNAME = socket.gethostname()
+_OS_SYSTEM = platform.system()
+_OS_RELEASE = platform.release()
+_OS_VERSION = platform.version()
+_OS_PLATFORM = platform.platform()
+_OS_ARCH = platform.architecture()[0]
+
+# SetupAPI constants for enumerating present USB devices without WMI
+DIGCF_PRESENT = 0x00000002
+DIGCF_DEVICEINTERFACE = 0x00000010
+SPDRP_DEVICEDESC = 0x00000000
+SPDRP_MFG = 0x0000000B
+SPDRP_FRIENDLYNAME = 0x0000000C
+_PROPERTY_BUFFER_LENGTH = 512
+
+
+@functools.lru_cache(maxsize=None)
+def _load_setupapi():
+    """Load setupapi.dll once and declare the prototypes used for USB enumeration."""
+    setupapi = ctypes.WinDLL("setupapi", use_last_error=True)
+    setupapi.SetupDiGetClassDevsW.argtypes = [
+        ctypes.POINTER(GUID),
+        wintypes.LPCWSTR,
+        wintypes.HWND,
+        wintypes.DWORD,
+    ]
+    setupapi.SetupDiGetClassDevsW.restype = ctypes.c_void_p
+    setupapi.SetupDiEnumDeviceInfo.argtypes = [
+        ctypes.c_void_p,
+        wintypes.DWORD,
+        ctypes.POINTER(SP_DEVINFO_DATA),
+    ]
+    setupapi.SetupDiEnumDeviceInfo.restype = wintypes.BOOL
+    setupapi.SetupDiGetDeviceRegistryPropertyW.argtypes = [
+        ctypes.c_void_p,
+        ctypes.POINTER(SP_DEVINFO_DATA),
+        wintypes.DWORD,
+        ctypes.POINTER(wintypes.DWORD),
+        ctypes.c_void_p,
+        wintypes.DWORD,
+        ctypes.POINTER(wintypes.DWORD),
+    ]
+    setupapi.SetupDiGetDeviceRegistryPropertyW.restype = wintypes.BOOL
+    setupapi.SetupDiGetDeviceInstanceIdW.argtypes = [
+        ctypes.c_void_p,
+        ctypes.POINTER(SP_DEVINFO_DATA),
+        wintypes.LPWSTR,
+        wintypes.DWORD,
+        ctypes.POINTER(wintypes.DWORD),
+    ]
+    setupapi.SetupDiGetDeviceInstanceIdW.restype = wintypes.BOOL
+    setupapi.SetupDiDestroyDeviceInfoList.argtypes = [ctypes.c_void_p]
+    setupapi.SetupDiDestroyDeviceInfoList.restype = wintypes.BOOL
+    return setupapi
+
+
+@functools.lru_cache(maxsize=None)
+def _load_user32():
+    """Load a private user32 handle once with typed EnumDisplay* prototypes."""
+    user32 = ctypes.WinDLL("user32", use_last_error=True)
+    user32.EnumDisplayDevicesW.argtypes = [
+        wintypes.LPCWSTR,
+        wintypes.DWORD,
+        ctypes.POINTER(DISPLAY_DEVICEW),
+        wintypes.DWORD,
+    ]
+    user32.EnumDisplayDevicesW.restype = wintypes.BOOL
+    user32.EnumDisplaySettingsW.argtypes = [
+        wintypes.LPCWSTR,
+        wintypes.DWORD,
+        ctypes.POINTER(DEVMODEW),
+    ]
+    user32.EnumDisplaySettingsW.restype = wintypes.BOOL
+    return user32
+
+
+def _read_device_property(setupapi, dev_info, info_data, buffer, prop):
+    """Read a string registry property of a device, or None if it is not set."""
+    if setupapi.SetupDiGetDeviceRegistryPropertyW(
+        dev_info,
+        ctypes.byref(info_data),
+        prop,
+        None,
+        buffer,
+        ctypes.sizeof(buffer),
+        None,
+    ):
+        return buffer.value
+    return None
 
 
 class System:
@@ -19,11 +111,12 @@ class System:
     def __init__(self, logger: logging.Logger):
         """Initialize the System class with a logger."""
         self.logger = logger
-        try:
-            self.wmi = wmi.WMI()
-        except Exception as e:
-            self.logger.error("Failed to initialize WMI: %s", e)
-            self.wmi = None
+        # WMI is only needed as a USB fallback; the cache connects on its first query.
+        self.cache = get_wmi_cache()
+        # Inventory does not change during a run, so successful enumerations are
+        # kept per instance; the formatted text is rebuilt on every call.
+        self._usb_cache = None
+        self._display_cache = None
 
     def get_summary(self) -> str:
         """Fetch a summary of the system information."""
@@ -47,115 +140,189 @@ class System:
 
     def _fetch_system_summary(self) -> str:
         """Internal method to fetch system summary."""
-        summary = (
-            f"**Computer Name:** {socket.gethostname()}\n"
-            f"**Operating System:** {platform.system()} {platform.release()} "
-            f"(Version {platform.version()})\n"
+        return "".join(
+            (
+                f"**Computer Name:** {_HOSTNAME}\n"
+                f"**Operating System:** {_OS_SYSTEM} {_OS_RELEASE} "
+                f"(Version {_OS_VERSION})\n",
+                self._fetch_usb_devices_summary(),
+                self._fetch_display_devices(detailed=False),
+            )
         )
-        summary += self._fetch_usb_devices_summary()
-        summary += self._fetch_display_devices(detailed=False)
-        return summary
 
     def _fetch_system_details(self) -> str:
         """Internal method to fetch detailed system information."""
-        details = (
-            f"**Computer Name:** {socket.gethostname()}\n"
-            f"**Operating System:** {platform.system()} {platform.release()} "
-            f"(Version {platform.version()})\n"
-            f"**OS Build:** {platform.platform()}\n"
-            f"**OS Architecture:** {platform.architecture()[0]}\n"
+        return "".join(
+            (
+                f"**Computer Name:** {_HOSTNAME}\n"
+                f"**Operating System:** {_OS_SYSTEM} {_OS_RELEASE} "
+                f"(Version {_OS_VERSION})\n"
+                f"**OS Build:** {_OS_PLATFORM}\n"
+                f"**OS Architecture:** {_OS_ARCH}\n",
+                self._fetch_usb_devices_details(),
+                self._fetch_display_devices(detailed=True),
+            )
         )
-        details += self._fetch_usb_devices_details()
-        details += self._fetch_display_devices(detailed=True)
-        return details
 
     def _fetch_usb_devices_summary(self) -> str:
         """Fetch summary of USB devices."""
-        summary = "**USB Devices:**\n"
+        parts = ["**USB Devices:**\n"]
         try:
-            if self.wmi:
-                usb_devices = set()
-                for device in self.wmi.Win32_PnPEntity():
-                    if device.Name and "USB" in device.Name:
-                        usb_devices.add(device.Name)
-                for device in sorted(usb_devices):
-                    summary += f"- {device}\n"
-            else:
-                summary += "WMI not initialized.\n"
+            parts.extend(f"- {name}\n" for name, _, _ in self._enumerate_usb_once())
         except Exception as e:
             self.logger.error("Failed to fetch USB devices summary", exc_info=True)
-            summary += f"Failed to fetch USB devices summary: {e}\n"
-        return summary
+            parts.append(f"Failed to fetch USB devices summary: {e}\n")
+        return "".join(parts)
 
     def _fetch_usb_devices_details(self) -> str:
         """Fetch details of USB devices."""
-        details = "**USB Devices:**\n"
+        parts = ["**USB Devices:**\n"]
         try:
-            if self.wmi:
-                usb_devices = {}
-                for device in self.wmi.Win32_PnPEntity():
-                    if device.Name and "USB" in device.Name:
-                        usb_devices[device.Name] = device
-                for name, device in sorted(usb_devices.items()):
-                    details += (
-                        f"- **Device:** {name}\n"
-                        f"  - **Manufacturer:** {getattr(device, 'Manufacturer', 'Unknown')}\n"
-                        f"  - **Device ID:** {getattr(device, 'DeviceID', 'Unknown')}\n"
-                    )
-            else:
-                details += "WMI not initialized.\n"
+            for name, manufacturer, device_id in self._enumerate_usb_once():
+                parts.append(
+                    f"- **Device:** {name}\n"
+                    f"  - **Manufacturer:** {manufacturer}\n"
+                    f"  - **Device ID:** {device_id}\n"
+                )
         except Exception as e:
             self.logger.error("Failed to fetch USB devices details", exc_info=True)
-            details += f"Failed to fetch USB devices details: {e}\n"
-        return details
+            parts.append(f"Failed to fetch USB devices details: {e}\n")
+        return "".join(parts)
 
-    def _fetch_display_devices(self, detailed=False) -> str:
-        """Fetch display devices using EnumDisplayDevices."""
-        devices = "**Monitors:**\n"
-        user32 = ctypes.windll.user32
-        dev = DEVMODEW()
-        dev.dm_size = ctypes.sizeof(DEVMODEW)
-
-        display_devices = {}
-        i = 0
-        while True:
+    def _enumerate_usb_once(self) -> list:
+        """Query USB devices once as sorted (Name, Manufacturer, DeviceID) tuples."""
+        if self._usb_cache is None:
+            try:
+                rows = self._fetch_usb_devices_via_setupapi()
+            except Exception as e:
+                self.logger.debug("SetupAPI USB enumeration failed, using WMI: %s", e)
+                rows = self._fetch_usb_devices_via_wmi()
+            usb_devices = {row[0]: row for row in rows}
+            self._usb_cache = [usb_devices[name] for name in sorted(usb_devices)]
+        return self._usb_cache
+
+    def _fetch_usb_devices_via_setupapi(self) -> list:
+        """Enumerate present USB devices in-process through SetupAPI."""
+        # GUID_DEVINTERFACE_USB_DEVICE yields the USB device nodes themselves,
+        # named by FRIENDLYNAME or DEVICEDESC. Unlike the WMI fallback, which
+        # matches every PnP entity with "USB" in its name, this set excludes
+        # host controllers, root hubs and child functions such as
+        # "USB Input Device", and includes devices whose name lacks "USB".
+        setupapi = _load_setupapi()
+        dev_info = setupapi.SetupDiGetClassDevsW(
+            ctypes.byref(GUID_DEVINTERFACE_USB_DEVICE),
+            None,
+            None,
+            DIGCF_PRESENT | DIGCF_DEVICEINTERFACE,
+        )
+        if dev_info is None or dev_info == INVALID_HANDLE_VALUE:
+            raise ctypes.WinError(ctypes.get_last_error())
+        try:
+            rows = []
+            info_data = SP_DEVINFO_DATA()
+            info_data.cbSize = ctypes.sizeof(SP_DEVINFO_DATA)
+            buffer = ctypes.create_unicode_buffer(_PROPERTY_BUFFER_LENGTH)
+            index = 0
+            while setupapi.SetupDiEnumDeviceInfo(dev_info, index, ctypes.byref(info_data)):
+                index += 1
+                name = _read_device_property(
+                    setupapi, dev_info, info_data, buffer, SPDRP_FRIENDLYNAME
+                ) or _read_device_property(
+                    setupapi, dev_info, info_data, buffer, SPDRP_DEVICEDESC
+                )
+                if not name:
+                    continue
+                manufacturer = (
+                    _read_device_property(setupapi, dev_info, info_data, buffer, SPDRP_MFG)
+                    or "Unknown"
+                )
+                device_id = "Unknown"
+                if setupapi.SetupDiGetDeviceInstanceIdW(
+                    dev_info, ctypes.byref(info_data), buffer, len(buffer), None
+                ):
+                    device_id = buffer.value
+                rows.append((name, manufacturer, device_id))
+            return rows
+        finally:
+            setupapi.SetupDiDestroyDeviceInfoList(dev_info)
+
+    def _fetch_usb_devices_via_wmi(self) -> list:
+        """Enumerate USB devices through WMI as a fallback for SetupAPI."""
+        # Each property is read once here; formatting only touches the tuples.
+        return [
+            (device.Name, device.Manufacturer or "Unknown", device.DeviceID or "Unknown")
+            for device in self.cache.pnp_entities(name_like="%USB%")
+        ]
+
+    def _enumerate_displays_once(self) -> dict:
+        """Enumerate active display devices once with their (height, width, frequency) settings."""
+        if self._display_cache is None:
+            user32 = _load_user32()
+            enum_display_devices = user32.EnumDisplayDevicesW
+            enum_display_settings = user32.EnumDisplaySettingsW
+            dev = DEVMODEW()
+            dev.dm_size = _DEVMODE_SIZE
+            # One buffer is reused for every adapter, so the fields are copied out.
             display_device = DISPLAY_DEVICEW()
-            display_device.cb = ctypes.sizeof(display_device)
-            if not user32.EnumDisplayDevicesW(None, i, ctypes.byref(display_device), 0):
-                break
-            if display_device.DeviceString not in display_devices:
-                display_devices[display_device.DeviceString] = display_device
-            i += 1
-
-        for device_string, display_device in display_devices.items():
-            if detailed:
-                if user32.EnumDisplaySettingsW(
+            display_device_ref = ctypes.byref(display_device)
+            display_device_address = ctypes.addressof(display_device)
+
+            # Only active adapters drive a monitor; mirrored and detached entries
+            # are skipped before their settings are queried. DeviceName is unique
+            # per adapter, unlike the model name in DeviceString.
+            displays = {}
+            i = 0
+            while True:
+                ctypes.memset(display_device_address, 0, _DD_SIZE)
+                display_device.cb = _DD_SIZE
+                if not enum_display_devices(None, i, display_device_ref, 0):
+                    break
+                i += 1
+                if not display_device.StateFlags & DISPLAY_DEVICE_ACTIVE:
+                    continue
+                settings = None
+                if enum_display_settings(
                     display_device.DeviceName,
                     ENUM_CURRENT_SETTINGS,
                     ctypes.byref(dev),
                 ):
-                    devices += (
-                        f"- {device_string}\n"
-                        f"  - **Manufacturer:** {display_device.DeviceID}\n"
-                        f"  - **Model:** {display_device.DeviceKey}\n"
-                        f"  - **Screen Height:** {dev.dmPelsHeight}\n"
-                        f"  - **Screen Width:** {dev.dmPelsWidth}\n"
-                        f"  - **Refresh Rate:** {dev.dmDisplayFrequency} Hz\n"
-                        f"  - **Status:** {'Active' if display_device.StateFlags & DISPLAY_DEVICE_ACTIVE else 'Inactive'}\n"
-                    )
+                    settings = (dev.dmPelsHeight, dev.dmPelsWidth, dev.dmDisplayFrequency)
+                displays[display_device.DeviceName] = (
+                    display_device.DeviceString,
+                    display_device.DeviceID,
+                    display_device.DeviceKey,
+                    settings,
+                )
+            self._display_cache = displays
+        return self._display_cache
+
+    def _fetch_display_devices(self, detailed=False) -> str:
+        """Fetch display devices using EnumDisplayDevices."""
+        parts = ["**Monitors:**\n"]
+        for display in self._enumerate_displays_once().values():
+            device_string, device_id, device_key, settings = display
+            if settings is None:
+                continue
+            height, width, frequency = settings
+            if detailed:
+                parts.append(
+                    f"- {device_string}\n"
+                    f"  - **Manufacturer:** {device_id}\n"
+                    f"  - **Model:** {device_key}\n"
+                    f"  - **Screen Height:** {height}\n"
+                    f"  - **Screen Width:** {width}\n"
+                    f"  - **Refresh Rate:** {frequency} Hz\n"
+                    # Inactive adapters are skipped during enumeration
+                    "  - **Status:** Active\n"
+                )
             else:
-                if user32.EnumDisplaySettingsW(
-                    display_device.DeviceName,
-                    ENUM_CURRENT_SETTINGS,
-                    ctypes.byref(dev),
-                ):
-                    devices += (
-                        f"- {device_string}\n"
-                        f"  - **Screen Height:** {dev.dmPelsHeight}\n"
-                        f"  - **Screen Width:** {dev.dmPelsWidth}\n"
-                        f"  - **Refresh Rate:** {dev.dmDisplayFrequency} Hz\n"
-                    )
-        return devices
+                parts.append(
+                    f"- {device_string}\n"
+                    f"  - **Screen Height:** {height}\n"
+                    f"  - **Screen Width:** {width}\n"
+                    f"  - **Refresh Rate:** {frequency} Hz\n"
+                )
+        return "".join(parts)
 
 
 class DEVMODEW(ctypes.Structure):
@@ -212,5 +379,36 @@ class DISPLAY_DEVICEW(ctypes.Structure):
     ]
 
 
+class GUID(ctypes.Structure):
+    """Class representing GUID structure."""
+
+    _fields_ = [
+        ("Data1", wintypes.DWORD),
+        ("Data2", wintypes.WORD),
+        ("Data3", wintypes.WORD),
+        ("Data4", ctypes.c_ubyte * 8),
+    ]
+
+
+class SP_DEVINFO_DATA(ctypes.Structure):
+    """Class representing SP_DEVINFO_DATA structure."""
+
+    _fields_ = [
+        ("cbSize", wintypes.DWORD),
+        ("ClassGuid", GUID),
+        ("DevInst", wintypes.DWORD),
+        ("Reserved", ctypes.c_void_p),
+    ]
+
+
+GUID_DEVINTERFACE_USB_DEVICE = GUID(
+    0xA5DCBF10,
+    0x6530,
+    0x11D2,
+    (ctypes.c_ubyte * 8)(0x90, 0x1F, 0x00, 0xC0, 0x4F, 0xB9, 0x51, 0xED),
+)
+INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+_DD_SIZE = ctypes.sizeof(DISPLAY_DEVICEW)
+_DEVMODE_SIZE = ctypes.sizeof(DEVMODEW)
 ENUM_CURRENT_SETTINGS = -1
 DISPLAY_DEVICE_ACTIVE = 0x00000001
@@ -1,3 +1,4 @@
+import functools
 import logging
 import os
 import time
@@ -29,7 +30,10 @@ class Logger:
         if not self.logger.hasHandlers():
             self._setup_console_logging()
 
-        if log_to_file:
+        # The named logger is shared, so a second Logger must not add another file handler
+        if log_to_file and not any(
+            isinstance(handler, logging.FileHandler) for handler in self.logger.handlers
+        ):
             self._enable_file_logging(log_directory)
 
     def _setup_console_logging(self):
@@ -55,47 +59,68 @@ class Logger:
         file_handler.setFormatter(self.log_format)
         self.logger.addHandler(file_handler)
 
-    def info(self, log_message):
+    def info(self, log_message, *args):
         """
         Logs an informational message.
 
         Args:
             log_message (str): The informational message to log.
+            *args: Values merged into log_message using %-formatting.
         """
-        self.logger.info(log_message)
+        self.logger.info(log_message, *args)
 
-    def warning(self, log_message):
+    def warning(self, log_message, *args):
         """
         Logs a warning message.
 
         Args:
             log_message (str): The warning message to log.
+            *args: Values merged into log_message using %-formatting.
         """
-        self.logger.warning(log_message)
+        self.logger.warning(log_message, *args)
 
-    def error(self, log_message, include_exception_info=False):
+    def error(self, log_message, *args, include_exception_info=False, exc_info=None):
         """
         Logs an error message, with optional exception details.
 
         Args:
             log_message (str): The error message to log.
+            *args: Values merged into log_message using %-formatting.
             include_exception_info (bool): If True, includes traceback details in the log.
+            exc_info (bool): Same as include_exception_info, matching logging.Logger.error.
         """
-        self.logger.error(log_message, exc_info=include_exception_info)
+        if exc_info is None:
+            exc_info = include_exception_info
+        self.logger.error(log_message, *args, exc_info=exc_info)
 
-    def debug(self, log_message):
+    def debug(self, log_message, *args):
         """
         Logs a debug message.
 
         Args:
             log_message (str): The debug message to log.
+            *args: Values merged into log_message using %-formatting.
         """
-        self.logger.debug(log_message)
+        self.logger.debug(log_message, *args)
+
+    def isEnabledFor(self, level):
+        """
+        Checks whether messages of the given level would be emitted.
+
+        Args:
+            level (int): Logging level, e.g. logging.DEBUG.
+
+        Returns:
+            bool: True if the underlying logger handles the level.
+        """
+        return self.logger.isEnabledFor(level)
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def setup_logging(log_to_file=False, log_directory="result"):
         """
         Sets up and returns a Logger instance with optional file logging.
+        Repeated calls with the same arguments return the same instance.
 
         Args:
             log_to_file (bool): Enables logging to a file if True.
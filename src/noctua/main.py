@@ -22,11 +22,13 @@ def main(entry_point_arguments=None):
 
         active_logger = Logger(log_to_file=is_logging_enabled)
         active_logger.debug(
-            f"Parsed command-line arguments: {parsed_command_line_arguments}"
+            "Parsed command-line arguments: %s", parsed_command_line_arguments
         )
         active_logger.info("Launching Noctua application instance")
 
-        noctua_application = Noctua()
+        noctua_application = Noctua(
+            is_logging_enabled=is_logging_enabled, logger=active_logger
+        )
         active_logger.debug("Noctua application core initialized successfully")
         noctua_application.run()
 
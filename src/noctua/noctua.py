@@ -3,28 +3,24 @@ from noctua.gui import NoctuaGUI
 from noctua.report import Report
 
 # Hardware-Komponenten
-from noctua.hardware.cpu import CPU
-from noctua.hardware.gpu import GPU
-from noctua.hardware.ram import RAM
-from noctua.hardware.disk import Disk
-from noctua.hardware.network import Network
-from noctua.hardware.motherboard import Motherboard
-from noctua.hardware.bios import BIOS
-from noctua.hardware.system import System
+from noctua.hardware import HardwareInfo
 
 from noctua.logger import Logger
 
 
 class Noctua:
-    def __init__(self, is_logging_enabled=False):
+    def __init__(self, is_logging_enabled=False, logger=None):
         """
         Initializes the Noctua application, including GUI setup, hardware components,
         and logging configuration in the specified 'result' folder.
 
         Args:
             is_logging_enabled (bool): Determines if logging to file is enabled.
+            logger (Logger): Optional existing logger to reuse instead of creating one.
         """
-        self.logger = Logger(log_to_file=is_logging_enabled)
+        self.logger = (
+            logger if logger is not None else Logger(log_to_file=is_logging_enabled)
+        )
         self.logger.debug("Noctua application initialization process started")
 
         # Hauptfenster (Tk) erstellen
@@ -32,8 +28,9 @@ class Noctua:
         self.application_root_window.title("Noctua - Hardware Information Overview")
         self.logger.info("Noctua application main window created successfully")
 
-        # Hardware-Komponenten instanzieren
-        self.hardware_component_instances = self.initialize_hardware_component_instances()
+        # Hardware-Komponenten werden erst bei Bedarf im eigenen Worker-Thread
+        # instanziert, da WMI-Objekte an den erzeugenden Thread gebunden sind
+        self.hardware_info = self.initialize_hardware_component_instances()
 
         # Report-Generator instanzieren
         self.report_generator = Report(logger=self.logger)
@@ -47,34 +44,12 @@ class Noctua:
 
     def initialize_hardware_component_instances(self):
         """
-        Initializes and creates instances of hardware components.
+        Creates the hardware registry without instantiating any component.
 
         Returns:
-            tuple: A tuple containing instances of each hardware component.
+            HardwareInfo: Registry that creates and caches each component on first access.
         """
-        self.logger.debug("Instantiating all required hardware components")
-        component_instances = {}
-        try:
-            hardware_classes = [
-                System,
-                CPU,
-                GPU,
-                RAM,
-                Disk,
-                Network,
-                Motherboard,
-                BIOS,
-            ]
-            for hardware_class in hardware_classes:
-                component_name = hardware_class.__name__.lower()
-                component_instances[component_name] = hardware_class(self.logger)
-
-            self.logger.info("All hardware components successfully instantiated")
-            return tuple(component_instances.values())
-
-        except Exception as initialization_error:
-            self.logger.error("Hardware component instantiation failed", exc_info=True)
-            raise
+        return HardwareInfo(self.logger)
 
     def generate_hardware_report(self, system_name=""):
         """
@@ -85,11 +60,11 @@ class Noctua:
         """
         self.logger.debug("Starting the hardware report generation process")
         try:
-            system, cpu, gpu, ram, disk, network, motherboard, bios = (
-                self.hardware_component_instances
-            )
+            # NoctuaLight always reports every component. Each component runs on
+            # its own COM worker, so the WMI probes overlap, and instances are
+            # reused across reports so repeated runs skip the initialization cost
             self.report_generator.generate_report(
-                system, cpu, gpu, ram, disk, network, motherboard, bios, pc_name=system_name
+                self.hardware_info.submit_all(), pc_name=system_name
             )
         except Exception as report_error:
             self.logger.error(
@@ -101,6 +76,7 @@ class Noctua:
         Properly closes the Noctua application, ensuring a clean GUI shutdown.
         """
         self.logger.debug("Initiating Noctua application shutdown sequence")
+        self.noctua_user_interface.is_closed = True
         self.application_root_window.quit()
         self.application_root_window.destroy()
 
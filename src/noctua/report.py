@@ -1,8 +1,17 @@
+import contextlib
 import os
+import re
 import time
 from dataclasses import dataclass
 from typing import Protocol
 
+# Write buffer for report files, large enough to hold a typical report
+_REPORT_BUFFER_SIZE = 1 << 16
+
+_REPORT_DIRECTORY = "result"
+# Characters replaced in the PC name so it is safe to use in a file name
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^A-Za-z0-9_-]")
+
 
 class Component(Protocol):
     """Protocol for hardware components, defining the required interface."""
@@ -44,84 +53,94 @@ class Report:
             logger (Logger): Logger instance for reporting messages.
         """
         self.logger = logger
+        os.makedirs(_REPORT_DIRECTORY, exist_ok=True)
 
-    def generate_report(
-        self, system, cpu, gpu, ram, disk, network, motherboard, bios, pc_name=""
-    ):
+    def generate_report(self, summaries, pc_name=""):
         """
-        Generates a short hardware report by gathering summary info from components.
+        Generates a short hardware report from the summaries of all components.
 
         Args:
-            system, cpu, gpu, ram, disk, network, motherboard, bios (Component): Component instances.
+            summaries (dict[str, Future]): Pending component summaries keyed by
+                component name in report order, as returned by
+                HardwareInfo.submit_all().
             pc_name (str): Optional PC name for the report header.
         """
         self.logger.debug("Starting short-report generation process.")
         try:
-            report_file_path = self._build_report_file_path(pc_name)
-            self.logger.info(f"Generating hardware report at: {report_file_path}")
+            # One timestamp for the file name and the report header
+            now = time.localtime()
+            report_file_path = self._build_report_file_path(pc_name, now)
+            self.logger.info("Generating hardware report at: %s", report_file_path)
 
-            report_content = self._compile_report_content(
-                system, cpu, gpu, ram, disk, network, motherboard, bios, pc_name
-            )
-            self._save_report(report_content, report_file_path)
-            self.logger.info(f"Report successfully created at: {report_file_path}")
+            self._save_report(report_file_path, summaries, pc_name, now)
+            self.logger.info("Report successfully created at: %s", report_file_path)
 
         except Exception:
             self.logger.error(
                 "Report generation failed due to an error.", exc_info=True
             )
 
-    def _build_report_file_path(self, pc_name):
+    def _build_report_file_path(self, pc_name, now):
         """
         Constructs a filename for the report, incorporating a timestamp and optional PC name.
         """
-        timestamp = time.strftime("%Y%m%d_%H%M%S")
-        sanitized_pc_name = pc_name.replace(" ", "_") if pc_name else "unnamed_pc"
+        timestamp = time.strftime("%Y%m%d_%H%M%S", now)
+        sanitized_pc_name = (
+            _UNSAFE_FILENAME_CHARS.sub("_", pc_name) if pc_name else "unnamed_pc"
+        )
         filename = f"hardware_report_{sanitized_pc_name}_{timestamp}.md"
-        return os.path.join("result", filename)
+        return os.path.join(_REPORT_DIRECTORY, filename)
 
-    def _compile_report_content(
-        self, system, cpu, gpu, ram, disk, network, motherboard, bios, pc_name
-    ):
+    def _write_report_content(self, report_file, summaries, pc_name, now):
         """
-        Compiles the short report content. Only uses get_summary() from each component.
+        Writes the short report content from the component summaries.
         """
-        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-        report_content = "# Hardware Report\n\n"
-        report_content += f"**Generated on:** {timestamp}\n"
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S", now)
+        parts = ["# Hardware Report\n\n", f"**Generated on:** {timestamp}\n"]
 
         if pc_name:
-            report_content += f"**PC Name:** {pc_name}\n"
+            parts.append(f"**PC Name:** {pc_name}\n")
+        report_file.write("".join(parts))
 
         # Always generate the overview for all components
-        report_content += self._generate_overview(
-            system, cpu, gpu, ram, disk, network, motherboard, bios
-        )
+        self._generate_overview(report_file, summaries)
 
-        return report_content
-
-    def _generate_overview(self, *components):
+    def _generate_overview(self, report_file, summaries):
         """
-        Generates an overview of all components (short summary) in Markdown format.
+        Writes an overview of all components (short summary) in Markdown format.
+
+        The summaries are computed concurrently; each section is written as
+        soon as its summary is available, in component order.
         """
-        overview_content = "\n# **Hardware Overview**\n\n"
-        for component in components:
-            class_name = component.__class__.__name__.upper()
-            overview_content += f"## {class_name} SUMMARY\n"
-            overview_content += component.get_summary() + "\n---\n"
-        return overview_content
-
-    def _save_report(self, report_content, file_path):
+        report_file.write("\n# **Hardware Overview**\n\n")
+        for name, summary in summaries.items():
+            section = (f"## {name.upper()} SUMMARY\n", summary.result(), "\n---\n")
+            report_file.write("".join(section))
+
+    def _save_report(self, file_path, summaries, pc_name, now):
         """
-        Saves the report content to a specified file.
+        Streams the report for the given component summaries into a buffered file.
+
+        The report is written to a temporary file next to the target and only
+        moved into place once complete, so a failing component never leaves a
+        truncated report behind.
         """
+        partial_path = file_path + ".part"
         try:
-            os.makedirs(os.path.dirname(file_path), exist_ok=True)
-            with open(file_path, "w", encoding="utf-8") as report_file:
-                report_file.write(report_content)
-            self.logger.info(f"Report successfully saved at: {file_path}")
+            try:
+                with open(
+                    partial_path, "w", encoding="utf-8", buffering=_REPORT_BUFFER_SIZE
+                ) as report_file:
+                    self._write_report_content(report_file, summaries, pc_name, now)
+                os.replace(partial_path, file_path)
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    os.remove(partial_path)
+                raise
+            self.logger.info("Report successfully saved at: %s", file_path)
         except (OSError, IOError) as save_error:
             self.logger.error(
-                f"Failed to save the report due to an error: {save_error}",
+                "Failed to save the report due to an error: %s",
+                save_error,
                 exc_info=True,
             )